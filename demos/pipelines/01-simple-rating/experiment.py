@@ -21,6 +21,25 @@ from psynet.trial.static import StaticNode, StaticTrial, StaticTrialMaker
 STIMULUS_DIR = Path("data/instrument_sounds")
 STIMULUS_PATTERN = "*.mp3"
 
+# The rating scales are identical on every trial, so we build them (and their survey designs) once
+# at import time. Only the page and control that wrap them need to be constructed per trial.
+RATING_SCALES = [
+    RatingScale(
+        name="brightness",
+        values=5,
+        title="Brightness",
+        min_description="Dark",
+        max_description="Bright",
+    ),
+    RatingScale(
+        name="roughness",
+        values=5,
+        title="Roughness",
+        min_description="Smooth",
+        max_description="Rough",
+    ),
+]
+
 
 def get_timeline():
     return Timeline(
@@ -54,22 +73,7 @@ class CustomTrial(StaticTrial):
                 "Please rate the sound. You can replay it as many times as you like.",
                 controls="Play",
             ),
-            MultiRatingControl(
-                RatingScale(
-                    name="brightness",
-                    values=5,
-                    title="Brightness",
-                    min_description="Dark",
-                    max_description="Bright",
-                ),
-                RatingScale(
-                    name="roughness",
-                    values=5,
-                    title="Roughness",
-                    min_description="Smooth",
-                    max_description="Rough",
-                ),
-            ),
+            MultiRatingControl(*RATING_SCALES),
             events={
                 "submitEnable": Event(is_triggered_by="promptEnd"),
             },
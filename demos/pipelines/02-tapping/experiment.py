@@ -13,8 +13,10 @@
 # TODO: PsyNet improvement - automatically extracting n_stimuli and stimuli durations instead of hardcoding them
 
 import psynet.experiment
+from dallinger import db
 from psynet.timeline import Timeline
 from psynet.trial.static import StaticTrialMaker
+from psynet.utils import wait_until
 
 # custom pre screening tests to make sure REPP works
 from .repp_prescreens import (
@@ -25,6 +27,7 @@ from .repp_prescreens import (
 
 from .repp_iso import get_isochronous_stimulus, TapTrialISO, iso_tapping_instructions
 from .repp_music import get_music_stimuli_loader, TapTrialMusic, music_tapping_instructions
+from .repp_utils import TapTrial, reanalyze_tap_trials
 
 
 ########################################################
@@ -86,3 +89,30 @@ isochronous_stimuli = [
 
 class Exp(psynet.experiment.Experiment):
     timeline = get_timeline()
+
+    def test_experiment(self):
+        super().test_experiment()
+
+        # The tapping analyses run asynchronously,
+        # so they may still be going when the bots finish.
+        def analyses_are_complete():
+            # End the transaction so that we see the latest analyses.
+            db.session.commit()
+            return all(
+                trial.async_post_trial_complete
+                for trial in TapTrial.query.filter(TapTrial.complete)
+            )
+
+        wait_until(
+            analyses_are_complete,
+            max_wait=60,
+            error_message="Timed out waiting for the tapping analyses to complete.",
+        )
+
+        trials = TapTrial.query.filter(TapTrial.complete).all()
+        failed = {trial.id: trial.analysis["failed"] for trial in trials}
+
+        assert reanalyze_tap_trials(n_processes=1) == len(trials)
+
+        for trial in TapTrial.query.filter(TapTrial.complete):
+            assert trial.analysis["failed"] == failed[trial.id]
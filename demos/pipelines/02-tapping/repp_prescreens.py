@@ -1,5 +1,6 @@
 import json
 import random
+from copy import deepcopy
 from importlib import resources
 from os.path import exists as file_exists
 from os.path import join as join_path
@@ -28,12 +29,38 @@ from psynet.timeline import (
 )
 from psynet.trial.audio import AudioRecordTrial
 from psynet.trial.static import StaticTrial, StaticTrialMaker
-from psynet.utils import get_logger
+from psynet.utils import get_logger, time_logger
 
+from .repp_scoring import EarlyExitPrescreen
 from .repp_utils import NumpySerializer
 
 logger = get_logger()
 
+# Example recordings shipped with PsyNet, which bots submit instead of real recordings.
+# These are resolved once at import time rather than every time a page is shown.
+FREE_TAPPING_BOT_RECORDING = (
+    resources.files("psynet") / "resources/repp/free_tapping_record.wav"
+)
+MARKERS_TEST_BOT_RECORDING = (
+    resources.files("psynet") / "resources/repp/markers_test_record.wav"
+)
+
+# The parts of the markers test stimulus definition that are shared by all its stimuli.
+MARKERS_TEST_DEFINITION = {
+    "markers_onsets": [
+        2000.0,
+        2280.0,
+        2510.0,
+        8550.022675736962,
+        8830.022675736962,
+        9060.022675736962,
+    ],
+    "stim_shifted_onsets": [4500.0, 5000.0, 5500.0],
+    "onset_is_played": [True, True, True],
+    "duration_sec": 12,
+    "correct_answer": 6,
+}
+
 
 class REPPVolumeCalibration(Module):
     def __init__(
@@ -322,8 +349,7 @@ class FreeTappingRecordTrial(AudioRecordTrial, StaticTrial):
                 show_meter=False,
                 controls=False,
                 auto_advance=False,
-                bot_response_media=resources.files("psynet")
-                / "resources/repp/free_tapping_record.wav",
+                bot_response_media=FREE_TAPPING_BOT_RECORDING,
             ),
             time_estimate=self.time_estimate,
             progress_display=ProgressDisplay(
@@ -344,9 +370,10 @@ class FreeTappingRecordTrial(AudioRecordTrial, StaticTrial):
 
         plot_title = "Participant {}".format(self.participant_id)
         repp_analysis = REPPAnalysis(config=sms_tapping)
-        _, _, stats = repp_analysis.do_analysis_tapping_only(
-            audio_file, plot_title, output_plot
-        )
+        with time_logger(f"{self.__class__.__name__}.analyze_recording"):
+            _, _, stats = repp_analysis.do_analysis_tapping_only(
+                audio_file, plot_title, output_plot
+            )
         # output
         num_resp_onsets_detected = stats["num_resp_onsets_detected"]
         min_responses_ok = (
@@ -396,7 +423,7 @@ class FreeTappingRecordTrial(AudioRecordTrial, StaticTrial):
             )
 
 
-class FreeTappingRecordTest(StaticTrialMaker):
+class FreeTappingRecordTest(EarlyExitPrescreen, StaticTrialMaker):
     """
     This pre-screening test is designed to quickly determine whether participants
     are able to provide valid tapping data. The task is also efficient in determining whether
@@ -406,7 +433,8 @@ class FreeTappingRecordTest(StaticTrialMaker):
     beginning of the experiment, after providing general instructions.
     This test is intended for unconstrained tapping experiments, where no markers are used.
     By default, we start with a warming up exercise where participants can hear their recording.
-    We then perform a test with two trials and exclude participants who fail more than once.
+    We then perform a test with two trials and exclude participants who fail more than once,
+    skipping any remaining trials once the outcome is certain (see :class:`EarlyExitPrescreen`).
     After the first trial, we provide feedback based on the number of detected taps. The only
     exclusion criterion to fail trials is based on the number of detected taps, by default set to
     a minimum of 3 taps. NOTE: this test should be given after a volume and a tapping calibration test.
@@ -493,8 +521,7 @@ class FreeTappingRecordTest(StaticTrialMaker):
                     show_meter=True,
                     controls=False,
                     auto_advance=False,
-                    bot_response_media=resources.files("psynet")
-                    / "resources/repp/free_tapping_record.wav",
+                    bot_response_media=FREE_TAPPING_BOT_RECORDING,
                 ),
                 time_estimate=5,
                 progress_display=ProgressDisplay(
@@ -583,8 +610,7 @@ class RecordMarkersTrial(AudioRecordTrial, StaticTrial):
                 show_meter=False,
                 controls=False,
                 auto_advance=False,
-                bot_response_media=resources.files("psynet")
-                / "resources/repp/markers_test_record.wav",
+                bot_response_media=MARKERS_TEST_BOT_RECORDING,
             ),
             time_estimate=self.time_estimate,
             progress_display=ProgressDisplay(
@@ -649,9 +675,10 @@ class RecordMarkersTrial(AudioRecordTrial, StaticTrial):
 
         title_in_graph = "Participant {}".format(self.participant_id)
         analysis = REPPAnalysis(config=sms_tapping)
-        output, analysis, is_failed = analysis.do_analysis(
-            info, audio_file, title_in_graph, output_plot
-        )
+        with time_logger(f"{self.__class__.__name__}.analyze_recording"):
+            output, analysis, is_failed = analysis.do_analysis(
+                info, audio_file, title_in_graph, output_plot
+            )
         num_markers_detected = int(analysis["num_markers_detected"])
         correct_answer = self.definition["correct_answer"]
 
@@ -665,7 +692,7 @@ class RecordMarkersTrial(AudioRecordTrial, StaticTrial):
         }
 
 
-class REPPMarkersTest(StaticTrialMaker):
+class REPPMarkersTest(EarlyExitPrescreen, StaticTrialMaker):
     """
     This markers test is used to determine whether participants are using hardware
     and software that meets the technical requirements of REPP, such as
@@ -676,7 +703,8 @@ class REPPMarkersTest(StaticTrialMaker):
     a test stimulus with six marker sounds. The stimulus is then recorded
     with the laptop's microphone and analyzed using the REPP's signal processing pipeline.
     During the marker playback time, participants are supposed to remain silent
-    (not respond).
+    (not respond). The test stops early once the participant is certain to pass or fail
+    (see :class:`EarlyExitPrescreen`).
 
     Parameters
     ----------
@@ -742,7 +770,7 @@ class REPPMarkersTest(StaticTrialMaker):
                     f"""
             <h3>Recording test</h3>
             <hr>
-            Now we will test the recording quality of your laptop. In {self.n_trials} trials, you will be
+            Now we will test the recording quality of your laptop. In up to {self.n_trials} trials, you will be
             asked to remain silent while we play and record a sound.
             <br><br>
             <img style="width:50%" src="{assets['rules_image'].url}"  alt="rules_image">
@@ -760,18 +788,7 @@ class REPPMarkersTest(StaticTrialMaker):
             Node(
                 definition={
                     "stim_name": f"audio{i + 1}.wav",
-                    "markers_onsets": [
-                        2000.0,
-                        2280.0,
-                        2510.0,
-                        8550.022675736962,
-                        8830.022675736962,
-                        9060.022675736962,
-                    ],
-                    "stim_shifted_onsets": [4500.0, 5000.0, 5500.0],
-                    "onset_is_played": [True, True, True],
-                    "duration_sec": 12,
-                    "correct_answer": 6,
+                    **deepcopy(MARKERS_TEST_DEFINITION),
                 },
                 assets={
                     "stimulus": ExternalAsset(
@@ -0,0 +1,80 @@
+import logging
+
+# Same logger as psynet.utils.get_logger(); this module is kept free of PsyNet imports
+# so that it can be tested without launching an experiment.
+logger = logging.getLogger("psynet")
+
+
+def prescreen_outcome_is_certain(
+    n_passed: int, n_failed: int, n_total: int, performance_threshold: float
+):
+    """
+    Determines whether the outcome of a prescreen scored by the proportion of passed trials
+    (``performance_check_type = "performance"``) is already certain.
+
+    Parameters
+    ----------
+
+    n_passed : int
+        Number of trials whose analysis is complete and that passed.
+
+    n_failed : int
+        Number of trials that failed.
+
+    n_total : int
+        Total number of trials the participant will take, including repeat trials.
+        Trials that have not been given yet, or whose analysis is still pending,
+        are the difference between ``n_total`` and ``n_passed + n_failed``.
+
+    performance_threshold : float
+        The proportion of trials that must pass for the participant to pass the prescreen.
+
+    Returns
+    -------
+
+    ``True`` if the participant would pass even if all remaining trials failed,
+    or would fail even if all remaining trials passed.
+    """
+    certain_pass = n_passed / n_total >= performance_threshold
+    certain_fail = 1 - n_failed / n_total < performance_threshold
+    return certain_pass or certain_fail
+
+
+class EarlyExitPrescreen:
+    """
+    Mixin for prescreen trial makers with ``performance_check_type = "performance"``
+    and ``check_performance_at_end=True``. Before each new trial (including repeat trials),
+    we check whether the outcome of the prescreen is already certain given the trials analyzed so far:
+    trials still awaiting analysis are assumed to fail when checking for a certain pass,
+    and assumed to pass when checking for a certain fail.
+    If so, we stop giving trials and go straight to the final performance check,
+    which is guaranteed to reach the same decision.
+    """
+
+    # This overrides the private TrialMaker._prepare_trial rather than prepare_trial,
+    # because in the PsyNet version pinned in requirements.txt (0b4fcb32) _prepare_trial
+    # only calls prepare_trial outside the repeat phase, and when that returns "exit"
+    # it enters the repeat phase and calls _prepare_repeat_trial in the same request.
+    # Checking here covers both phases with a single trial query per request.
+    def _prepare_trial(self, experiment, participant, leader=None):
+        if self.outcome_is_certain(participant):
+            logger.info(
+                "Participant %i: outcome of %s is already certain, skipping remaining trials.",
+                participant.id,
+                self.id,
+            )
+            return None, "exit"
+        return super()._prepare_trial(
+            experiment=experiment, participant=participant, leader=leader
+        )
+
+    def outcome_is_certain(self, participant):
+        trials = self.get_participant_trials(participant)
+        return prescreen_outcome_is_certain(
+            n_passed=len(
+                [t for t in trials if t.async_post_trial_complete and not t.failed]
+            ),
+            n_failed=len([t for t in trials if t.failed]),
+            n_total=self.expected_trials_per_participant + self.n_repeat_trials,
+            performance_threshold=self.performance_threshold,
+        )
@@ -1,7 +1,12 @@
 import json
+import os
 import tempfile
+import time
+from collections import deque
+from multiprocessing import Pool
 import numpy as np
 
+from dallinger import db
 from markupsafe import Markup
 
 from repp.analysis import REPPAnalysis
@@ -12,11 +17,16 @@ from psynet.modular_page import AudioPrompt, AudioRecordControl, ModularPage
 from psynet.timeline import ProgressDisplay, ProgressStage
 from psynet.trial.audio import AudioRecordTrial
 from psynet.trial.static import StaticTrial
+from psynet.utils import get_logger, time_logger
+
+logger = get_logger()
 
 
 class TapTrial(AudioRecordTrial, StaticTrial):
     def get_info(self):
-        with tempfile.NamedTemporaryFile() as f:
+        with tempfile.NamedTemporaryFile() as f, time_logger(
+            f"{self.__class__.__name__}.get_info"
+        ):
             self.assets["stimulus"].export_subfile("info.json", f.name)
             with open(f.name, "r") as reader:
                 return json.loads(
@@ -25,21 +35,9 @@ class TapTrial(AudioRecordTrial, StaticTrial):
 
     def analyze_recording(self, audio_file: str, output_plot: str):
         info = self.get_info()
-        stim_name = info["stim_name"]
         title_in_graph = "Participant {}".format(self.participant_id)
-        analysis = REPPAnalysis(config=sms_tapping)
-        output, analysis, is_failed = analysis.do_analysis(
-            info, audio_file, title_in_graph, output_plot
-        )
-        output = json.dumps(output, cls=NumpySerializer)
-        analysis = json.dumps(analysis, cls=NumpySerializer)
-        return {
-            "failed": is_failed["failed"],
-            "reason": is_failed["reason"],
-            "output": output,
-            "analysis": analysis,
-            "stim_name": stim_name,
-        }
+        with time_logger(f"{self.__class__.__name__}.analyze_recording"):
+            return analyze_tapping(info, audio_file, title_in_graph, output_plot)
 
     def show_trial(self, experiment, participant):
         info = self.get_info()
@@ -115,6 +113,235 @@ class TapTrial(AudioRecordTrial, StaticTrial):
         return audio_path
 
 
+def analyze_tapping(info: dict, audio_file: str, title_in_graph: str, output_plot: str):
+    """
+    Runs the REPP analysis for a single tapping recording.
+    This is a plain function rather than a ``TapTrial`` method so that it can also be run
+    in worker processes, see :func:`reanalyze_tap_trials`.
+    """
+    analysis = REPPAnalysis(config=sms_tapping)
+    output, analysis, is_failed = analysis.do_analysis(
+        info, audio_file, title_in_graph, output_plot
+    )
+    output = json.dumps(output, cls=NumpySerializer)
+    analysis = json.dumps(analysis, cls=NumpySerializer)
+    return {
+        "failed": is_failed["failed"],
+        "reason": is_failed["reason"],
+        "output": output,
+        "analysis": analysis,
+        "stim_name": info["stim_name"],
+    }
+
+
+def try_analyze_tapping(trial_id: int, *args):
+    """
+    Wraps :func:`analyze_tapping` for :func:`reanalyze_tap_trials`, so that a recording
+    that REPP cannot analyze doesn't abort the whole run. Returns ``None`` on failure.
+    """
+    try:
+        return analyze_tapping(*args)
+    except Exception:
+        logger.exception("Failed to reanalyze tapping trial %i", trial_id)
+        return None
+
+
+def reanalyze_tap_trials(
+    trial_class=TapTrial,
+    trial_ids=None,
+    start_after_id: int = 0,
+    batch_size: int = 20,
+    n_processes=None,
+):
+    """
+    Recomputes the stored REPP analysis for completed tapping trials, for example
+    after changing ``sms_tapping`` or fixing a bug in the analysis.
+    This is a plain function rather than a command-line tool: it needs the experiment's
+    database and asset storage, so it must be called from within the experiment's app context
+    (e.g. in a debugging session).
+
+    Trials are streamed in order of ID: while the worker processes analyze one set of recordings,
+    the next recordings are exported, so that downloads and analyses overlap.
+    Stimulus ``info.json`` files are only exported once per stimulus.
+    The new analyses and analysis plots are written back in order, committing every ``batch_size`` trials.
+    Trials whose recording hasn't been deposited are skipped, and trials that cannot be exported
+    or analyzed are logged and left unchanged, so a single bad trial doesn't stop the run.
+
+    Trial failure status is not updated. Trials where the recomputed ``analysis["failed"]``
+    no longer matches whether the trial was failed by its analysis
+    (``trial.failed_reason == "analysis"``, see :func:`analysis_status_changed`) are logged.
+
+    Parameters
+    ----------
+
+    trial_class :
+        The trial class to reanalyze, default: ``TapTrial`` (i.e. both isochronous and music trials).
+
+    trial_ids :
+        Optional list of trial IDs to restrict the run to, e.g. to retry the trials
+        that were logged as failed in a previous run.
+
+    start_after_id : int
+        Only reanalyze trials with IDs greater than this, default: 0.
+        The last trial ID is logged after each commit, so an interrupted run can be resumed
+        by passing that ID here.
+
+    batch_size : int
+        Number of trials to write back per commit, default: 20.
+
+    n_processes :
+        Number of worker processes, default: the number of CPUs.
+
+    Returns
+    -------
+
+    The number of trials that were reanalyzed.
+    """
+    n_processes = n_processes or os.cpu_count()
+    n_reanalyzed = 0
+    failed_trial_ids = []
+    changed_status_trial_ids = []
+    info_by_stimulus = {}
+    pending = deque()
+    last_saved_id = start_after_id
+    time_started = time.monotonic()
+
+    query = trial_class.query.filter(trial_class.complete)
+    if trial_ids is not None:
+        query = query.filter(trial_class.id.in_(trial_ids))
+
+    def save(trial, result):
+        nonlocal n_reanalyzed, last_saved_id
+        analysis = result.get()
+        os.remove(f"{tempdir}/{trial.id}.wav")
+        if analysis is None:
+            failed_trial_ids.append(trial.id)
+            return
+        try:
+            replace_analysis_plot(trial, f"{tempdir}/{trial.id}.png")
+        except Exception:
+            logger.exception(
+                "Failed to upload the analysis plot for tapping trial %i", trial.id
+            )
+            failed_trial_ids.append(trial.id)
+            return
+        if analysis_status_changed(trial, analysis):
+            changed_status_trial_ids.append(trial.id)
+        trial.analysis = analysis
+        n_reanalyzed += 1
+        last_saved_id = trial.id
+        if n_reanalyzed % batch_size == 0:
+            commit()
+
+    def commit():
+        db.session.commit()
+        logger.info(
+            "Reanalyzed %i tapping trials so far (%.2f trials/s), last trial ID: %i",
+            n_reanalyzed,
+            n_reanalyzed / (time.monotonic() - time_started),
+            last_saved_id,
+        )
+
+    with Pool(n_processes) as pool, tempfile.TemporaryDirectory() as tempdir:
+        for trial in iterate_trials(query, trial_class, start_after_id, batch_size):
+            if trial.recording is None or not trial.recording.deposited:
+                continue
+            audio_file = f"{tempdir}/{trial.id}.wav"
+            try:
+                trial.recording.export(audio_file)
+                trial.sanitize_recording(audio_file)
+                stimulus_id = trial.assets["stimulus"].id
+                if stimulus_id not in info_by_stimulus:
+                    info_by_stimulus[stimulus_id] = trial.get_info()
+            except Exception:
+                logger.exception(
+                    "Failed to export the recording or info for tapping trial %i",
+                    trial.id,
+                )
+                failed_trial_ids.append(trial.id)
+                continue
+            job = (
+                trial.id,
+                info_by_stimulus[stimulus_id],
+                audio_file,
+                "Participant {}".format(trial.participant_id),
+                f"{tempdir}/{trial.id}.png",
+            )
+            pending.append((trial, pool.apply_async(try_analyze_tapping, job)))
+            # Keep enough recordings queued to keep all workers busy while we export
+            # the next ones, without exporting the whole table ahead of the analysis.
+            if len(pending) > 2 * n_processes:
+                save(*pending.popleft())
+
+        while pending:
+            save(*pending.popleft())
+
+    if n_reanalyzed % batch_size != 0:
+        commit()
+
+    if failed_trial_ids:
+        logger.warning(
+            "Could not reanalyze %i tapping trials, retry them with trial_ids=%s",
+            len(failed_trial_ids),
+            failed_trial_ids,
+        )
+    if changed_status_trial_ids:
+        logger.warning(
+            "Reanalysis changed the outcome of %i tapping trials: %s",
+            len(changed_status_trial_ids),
+            changed_status_trial_ids,
+        )
+
+    return n_reanalyzed
+
+
+def iterate_trials(query, trial_class, start_after_id: int, batch_size: int):
+    """
+    Yields the trials matching ``query`` in order of ID, loading ``batch_size`` trials at a time.
+    """
+    while True:
+        trials = (
+            query.filter(trial_class.id > start_after_id)
+            .order_by(trial_class.id)
+            .limit(batch_size)
+            .all()
+        )
+        if len(trials) == 0:
+            return
+        start_after_id = trials[-1].id
+        yield from trials
+
+
+def analysis_status_changed(trial, analysis: dict):
+    """
+    Determines whether a recomputed analysis would change whether the trial is failed by its analysis.
+    Trials can also be failed for other reasons (e.g. ``premature_exit``),
+    in which case ``trial.failed_reason`` records the first reason only.
+    """
+    if analysis["failed"]:
+        return not trial.failed
+    return trial.failed_reason == "analysis"
+
+
+def replace_analysis_plot(trial, plot_path: str):
+    """
+    Uploads a new analysis plot for the trial.
+    ``trial.upload_plot`` creates a new asset under the same key as the existing plot,
+    whose export path would clash with the original, so existing plots are overwritten
+    in their storage location instead.
+    """
+    if not os.path.exists(plot_path):
+        return
+    plot = trial.recording_analysis_plot
+    if plot is None:
+        trial.upload_plot(plot_path, async_=False)
+        return
+    plot.input_path = plot_path
+    plot.size_mb = plot.get_size_mb()
+    plot.md5_contents = plot.get_md5_contents()
+    plot.storage.receive_deposit(plot, plot.host_path, async_=False, delete_input=True)
+
+
 class NumpySerializer(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, np.integer):
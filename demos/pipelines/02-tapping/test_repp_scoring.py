@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from repp_scoring import EarlyExitPrescreen, prescreen_outcome_is_certain
+
+
+def test_markers_test_outcome():
+    # REPPMarkersTest: 3 trials, performance_threshold=0.6, i.e. at least 2 trials must pass.
+    def is_certain(n_passed, n_failed):
+        return prescreen_outcome_is_certain(
+            n_passed=n_passed, n_failed=n_failed, n_total=3, performance_threshold=0.6
+        )
+
+    assert not is_certain(n_passed=0, n_failed=0)
+    assert not is_certain(n_passed=1, n_failed=0)
+    assert not is_certain(n_passed=0, n_failed=1)
+    assert not is_certain(n_passed=1, n_failed=1)
+    assert is_certain(n_passed=2, n_failed=0)
+    assert is_certain(n_passed=0, n_failed=2)
+
+
+class TrialMaker:
+    # Stands in for PsyNet's TrialMaker, which would give the participant another trial.
+    def _prepare_trial(self, experiment, participant, leader=None):
+        return "next trial", "available"
+
+
+class Prescreen(EarlyExitPrescreen, TrialMaker):
+    id = "prescreen"
+
+    def __init__(self, expected_trials_per_participant, n_repeat_trials, threshold):
+        self.expected_trials_per_participant = expected_trials_per_participant
+        self.n_repeat_trials = n_repeat_trials
+        self.performance_threshold = threshold
+
+
+def passed():
+    return SimpleNamespace(async_post_trial_complete=True, failed=False)
+
+
+def failed():
+    return SimpleNamespace(async_post_trial_complete=True, failed=True)
+
+
+def pending():
+    return SimpleNamespace(async_post_trial_complete=False, failed=False)
+
+
+def prepare_trial(prescreen, trials):
+    participant = SimpleNamespace(id=1)
+    with mock.patch.object(
+        prescreen, "get_participant_trials", create=True, return_value=trials
+    ) as get_participant_trials:
+        result = prescreen._prepare_trial(experiment=None, participant=participant)
+    get_participant_trials.assert_called_once_with(participant)
+    return result
+
+
+def test_pending_trials():
+    markers_test = Prescreen(3, n_repeat_trials=0, threshold=0.6)
+
+    # A pending trial could still pass or fail, so it doesn't decide the outcome either way...
+    assert prepare_trial(markers_test, [passed(), pending()]) == (
+        "next trial",
+        "available",
+    )
+    assert prepare_trial(markers_test, [failed(), pending()]) == (
+        "next trial",
+        "available",
+    )
+    # ...but doesn't hold up an outcome that the other trials already decide.
+    assert prepare_trial(markers_test, [passed(), passed(), pending()]) == (
+        None,
+        "exit",
+    )
+    assert prepare_trial(markers_test, [failed(), failed(), pending()]) == (
+        None,
+        "exit",
+    )
+
+
+def test_free_tapping_test_repeat_phase():
+    # FreeTappingRecordTest: 1 node plus 1 repeat trial, performance_threshold=0.5.
+    free_tapping_test = Prescreen(1, n_repeat_trials=1, threshold=0.5)
+
+    # Passing the first trial already guarantees a pass, so the repeat trial is skipped...
+    assert prepare_trial(free_tapping_test, [passed()]) == (None, "exit")
+    # ...but after failing it, the repeat trial decides the outcome.
+    assert prepare_trial(free_tapping_test, [failed()]) == (
+        "next trial",
+        "available",
+    )
+    assert prepare_trial(free_tapping_test, [pending()]) == (
+        "next trial",
+        "available",
+    )
@@ -56,6 +56,7 @@ def list_stimuli():
 class Exp(psynet.experiment.Experiment):
     timeline = get_timeline()
     test_n_bots = 20
+    test_mode = "parallel"  # run the bots concurrently, as real participants would be
 
     def test_experiment(self):
         # Run this with `psynet test local`
@@ -4,6 +4,7 @@ In this experiment participants listen to pairs of sounds and rate their similar
 
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+from itertools import permutations
 from math import comb
 from pathlib import Path
 
@@ -25,6 +26,9 @@ N_TRIALS_PER_PARTICIPANT = 10
 
 
 def get_nodes():
+    # One node per ordered pair of distinct stimuli. The nodes only store the stimulus names;
+    # the audio files are shared trial-maker assets (see get_assets), so we don't create
+    # a separate asset link for each of the n * (n - 1) nodes.
     stimuli = list_stimuli()
     return [
         StaticNode(
@@ -33,9 +37,7 @@ def get_nodes():
                 "stimulus_b": stimulus_b["name"],
             },
         )
-        for stimulus_a in stimuli
-        for stimulus_b in stimuli
-        if stimulus_a["name"] != stimulus_b["name"]
+        for stimulus_a, stimulus_b in permutations(stimuli, 2)
     ]
 
 